@@ -1,14 +1,20 @@
 import argparse
+import functools
 import json
 import logging
 import os
 import re
+import shutil
 import sys
-from multiprocessing import Pool
+from collections import Counter
+from collections.abc import Iterator
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
+from subprocess import DEVNULL
 from subprocess import PIPE
-from subprocess import Popen
+from subprocess import run as subproc_run
 from time import perf_counter
+from typing import NamedTuple
 
 try:
     from tqdm import tqdm
@@ -19,8 +25,101 @@ except ImportError:
         '\nPlease verify its installation, "pip install tqdm", and try again.'
     )
 
+try:
+    # Optional, decodes the mkvmerge output bytes several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+if sys.platform == "win32":
+    # Keeps a console window from opening for every mkvtoolnix subprocess
+    from subprocess import CREATE_NO_WINDOW as SUBPROCESS_CREATION_FLAGS
+else:
+    SUBPROCESS_CREATION_FLAGS = 0
+
 __version__ = "1.3.3"
 LOGGER = logging.getLogger(__name__)
+MODULE_DIR = os.path.dirname(__file__)
+# The platform's per user cache dir: %LOCALAPPDATA% on windows, $XDG_CACHE_HOME (or ~/.cache) elsewhere
+PROBE_CACHE_PATH = os.path.join(
+    (
+        os.environ.get("LOCALAPPDATA")
+        if sys.platform == "win32"
+        else os.environ.get("XDG_CACHE_HOME")
+    )
+    or os.path.join(os.path.expanduser("~"), ".cache"),
+    "MKVAudioSubsDefaulter",
+    "probe_cache.json",
+)
+# Bumped whenever the cache entry layout (or TrackInfo) changes, older caches are then ignored
+PROBE_CACHE_VERSION = 1
+
+# mkvmerge track properties, in TrackInfo field order ("text_subtitles" is read separately)
+TRACK_PROPERTIES = ("language", "track_name", "default_track", "enabled_track", "forced_track")
+
+
+class TrackInfo(NamedTuple):
+    """:description: Properties of an audio or subtitle track reported by mkvmerge"""
+
+    language: str
+    name: str
+    default: bool
+    enabled: bool
+    forced: bool
+    text_subtitles: bool
+
+
+class FileCounts(NamedTuple):
+    """:description: Outcome counts of processing a single media file (summed for the run summary)"""
+
+    successful: int = 0
+    estimated_successful: int = 0
+    unchanged: int = 0
+    missing_tracks: int = 0
+    invalid: int = 0
+    failed: int = 0
+
+
+@functools.lru_cache(maxsize=1)
+def _read_language_codes() -> tuple:
+    # Single bytes read decoded explicitly, the file is UTF-8 whatever the platform locale is
+    with open(os.path.join(MODULE_DIR, "language_codes.txt"), "rb") as f:
+        return tuple(f.read().decode("utf-8").splitlines())
+
+
+@functools.lru_cache(maxsize=1)
+def _valid_language_codes() -> frozenset:
+    return frozenset(line.partition(":")[0] for line in _read_language_codes())
+
+
+def _mkvtoolnix_error_message(output: bytes) -> str:
+    # Only JSON output (mkvmerge -J) is parsed for its "errors", plain text output is used as is
+    if output.lstrip().startswith(b"{"):
+        try:
+            return "".join(json_loads(output).get("errors", ()))
+        except ValueError:
+            pass
+
+    return output.decode("utf8", errors="replace")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_binary(binary_location: str, binary_name: str) -> str:
+    # Resolved once per location and reused for every media file (PATH is not searched per exec)
+    if binary_location:
+        return str(Path(binary_location))
+
+    return shutil.which(binary_name) or binary_name
+
+
+@functools.lru_cache(maxsize=None)
+def _track_lang_codes(audio_lang_code: str, subtitle_lang_code: str) -> tuple:
+    # Lowercased once, (code, track_type) pairs for only the track types being changed
+    return tuple(
+        (code.lower(), track_type)
+        for code, track_type in [(audio_lang_code, "audio"), (subtitle_lang_code, "subtitles")]
+        if code is not None
+    )
 
 
 class MKVAudioSubsDefaulter(object):
@@ -52,6 +151,9 @@ class MKVAudioSubsDefaulter(object):
     :type mkvmerge_location: str, optional
     :param dry_run: If set, no changes will be made to files but summary of predicted changes will be outputted
     :type dry_run: bool, optional
+    :param use_cache: If set, reuse the media file info of files unchanged since the previous run, the info is
+        saved to "PROBE_CACHE_PATH" (in the user's cache dir), even on a dry run (Default: False)
+    :type use_cache: bool, optional
     """
 
     def __init__(
@@ -68,6 +170,7 @@ class MKVAudioSubsDefaulter(object):
         mkvpropedit_location: str = None,
         mkvmerge_location: str = None,
         dry_run: bool = False,
+        use_cache: bool = False,
     ):
         self.log_level = log_level
         self.file_or_library_path = file_or_library_path
@@ -81,6 +184,33 @@ class MKVAudioSubsDefaulter(object):
         self.mkvpropedit_location = mkvpropedit_location
         self.mkvmerge_location = mkvmerge_location
         self.dry_run = dry_run
+        self.use_cache = use_cache
+
+        # {abs_file_path: [size, mtime_ns, {track_type: [[track_id, *track_info], ...]}]}
+        self._probe_cache = {}
+
+    # The values below are derived from the public attributes each time they are read (cheaply, the
+    # costly parts are cached per distinct value), so changing an attribute after __init__ takes effect
+    @property
+    def _mkvmerge_path(self) -> str:
+        return _resolve_binary(self.mkvmerge_location, "mkvmerge")
+
+    @property
+    def _mkvpropedit_path(self) -> str:
+        return _resolve_binary(self.mkvpropedit_location, "mkvpropedit")
+
+    @property
+    def _regex_filter(self) -> re.Pattern or None:
+        # re.compile keeps its own cache of compiled patterns
+        return re.compile(self.regex_filter) if self.regex_filter else None
+
+    @property
+    def _file_extensions(self) -> tuple:
+        return tuple(ext.lower() for ext in self.file_extensions)
+
+    @property
+    def _track_lang_codes(self) -> tuple:
+        return _track_lang_codes(self.audio_lang_code, self.subtitle_lang_code)
 
     def set_log_level(self) -> str:
         log_levels = {
@@ -103,40 +233,75 @@ class MKVAudioSubsDefaulter(object):
         return str(log_levels[self.log_level][1])
 
     @staticmethod
-    def list_directories(root_dir: str, depth: int) -> list:
-        directories = []
-
-        def list_dirs_recursive(current_dir, current_depth):
-            if current_depth <= depth:
-                directories.append(current_dir)
-
-                for item in os.listdir(current_dir):
-                    full_path = os.path.join(current_dir, item)
-
-                    if os.path.isdir(full_path):
-                        list_dirs_recursive(full_path, current_depth + 1)
+    def scan_directory(
+        directory: str, file_extensions: tuple, regex_filter: re.Pattern = None
+    ) -> tuple[list, list]:
+        media_files = []
+        sub_dirs = []
+
+        # DirEntry caches the file type from the directory listing, so no extra stat calls are made.
+        # Extensions are matched case-insensitively ("file_extensions" are expected lowercased)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Name check first, is_file() still needs a stat where readdir reports no file type
+                if entry.name.lower().endswith(file_extensions) and entry.is_file():
+                    if regex_filter is None or regex_filter.match(entry.name):
+                        media_files.append(entry)
+                elif entry.is_dir():
+                    sub_dirs.append(entry.path)
+
+        return media_files, sub_dirs
 
-        list_dirs_recursive(root_dir, 0)
-
-        return directories
+    @staticmethod
+    def iter_media_files(
+        root_dir: str,
+        depth: int,
+        file_extensions: tuple,
+        pool_size: int = 1,
+        regex_filter: re.Pattern = None,
+    ) -> Iterator[os.DirEntry]:
+        directories = [root_dir]
+        current_depth = 0
+
+        # Directories of the same depth are scanned concurrently to hide per-directory latency
+        # (network shares, spinning disks), the pool size also bounds the open directory handles
+        with ThreadPool(processes=pool_size) as pool:
+            while directories:
+                sub_dirs = []
+
+                for media_files, child_dirs in pool.imap(
+                    functools.partial(
+                        MKVAudioSubsDefaulter.scan_directory,
+                        file_extensions=file_extensions,
+                        regex_filter=regex_filter,
+                    ),
+                    directories,
+                ):
+                    yield from media_files
+                    sub_dirs.extend(child_dirs)
+
+                current_depth += 1
+                directories = sub_dirs if current_depth <= depth else []
 
     @staticmethod
-    def get_language_codes(print_codes: bool = False) -> dict or None:
-        with open(os.path.join(os.path.dirname(__file__), "language_codes.txt"), "r") as f:
-            lines = f.readlines()
+    def get_language_codes(print_codes: bool = False) -> tuple or None:
+        lines = _read_language_codes()
 
         if print_codes:
-            # Get terminal size
-            terminal_width = os.get_terminal_size().columns
+            # Get terminal size (falls back to 80 columns when the output is not a terminal)
+            terminal_width = shutil.get_terminal_size().columns
 
-            # Calculate the number of columns based on the terminal width
+            # Calculate the number of columns based on the terminal width (at least one)
             max_column_width = max(len(line.strip()) for line in lines)
-            num_columns = terminal_width // (max_column_width + 1)  # Add padding between columns
+            num_columns = max(
+                1, terminal_width // (max_column_width + 1)
+            )  # Add padding between columns
 
             # Calculate the number of lines per column
             num_lines_per_column = (len(lines) + num_columns - 1) // num_columns
 
-            # Print the lines in dynamic number of columns
+            # Build every row first and write them to the console in one go
+            rows = []
             for i in range(num_lines_per_column):
                 columns = [
                     (
@@ -147,108 +312,219 @@ class MKVAudioSubsDefaulter(object):
                     for j in range(num_columns)
                 ]
 
-                print(
-                    "".join(
-                        "{:<{width}}".format(column, width=max_column_width + 2)
-                        for column in columns
-                    )
-                )
+                rows.append("".join(f"{column:<{max_column_width + 2}}" for column in columns))
+
+            sys.stdout.write("\n".join(rows) + "\n")
+            sys.stdout.flush()
         else:
             return lines
 
     def verify_language_code(self, lang_code: str, track_type: str) -> bool:
-        if lang_code not in [
-            code.split(":")[0] for code in self.get_language_codes(print_codes=False)
-        ]:
+        if lang_code not in _valid_language_codes():
             raise Exception(
                 f"[!] {track_type.capitalize()} language code "
                 f'("{lang_code}") could not be found/verified, check code and try again [!]'
             )
         return True
 
-    def process_media_file_info(self, file_path: str) -> [str, str]:
-        def extract_track_info(track: dict) -> dict:
-            track_prop = track["properties"]
+    @staticmethod
+    def extract_track_info(track: dict) -> TrackInfo:
+        properties = track["properties"]
+
+        return TrackInfo(
+            *map(properties.get, TRACK_PROPERTIES),
+            properties.get("text_subtitles") if track["type"] == "subtitles" else None,
+        )
+
+    @staticmethod
+    def load_probe_cache(cache_path: str = PROBE_CACHE_PATH) -> dict:
+        try:
+            with open(cache_path, "rb") as f:
+                probe_cache = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+        # A cache from another version (or not written by this tool) is ignored, not trusted
+        if (
+            not isinstance(probe_cache, dict)
+            or probe_cache.get("version") != PROBE_CACHE_VERSION
+            or not isinstance(probe_cache.get("files"), dict)
+        ):
+            return {}
+
+        return probe_cache["files"]
+
+    @staticmethod
+    def save_probe_cache(probe_cache: dict, cache_path: str = PROBE_CACHE_PATH) -> None:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+            # Write to a temp file first so an interrupted run never leaves a truncated cache
+            with open(f"{cache_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": PROBE_CACHE_VERSION, "files": probe_cache}, f)
+            os.replace(f"{cache_path}.tmp", cache_path)
+        except OSError as e:
+            LOGGER.warning('Unable to save the media file info cache "%s": %s', cache_path, e)
+
+    @staticmethod
+    def probe_cache_entry(file_stat: os.stat_result, tracks_info: dict) -> list:
+        return [
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            {
+                track_type: [[track_id, *track] for track_id, track in tracks.items()]
+                for track_type, tracks in tracks_info.items()
+            },
+        ]
 
+    @staticmethod
+    def cached_tracks_info(cache_entry: list, file_stat: os.stat_result) -> dict or None:
+        if (
+            not isinstance(cache_entry, list)
+            or len(cache_entry) != 3
+            or cache_entry[:2] != [file_stat.st_size, file_stat.st_mtime_ns]
+        ):
+            return None
+
+        # A malformed entry is treated as a cache miss, the file then simply gets probed again
+        try:
             return {
-                "language": track_prop.get("language"),
-                "name": track_prop.get("track_name"),
-                "default": track_prop.get("default_track"),
-                "enabled": track_prop.get("enabled_track"),
-                "forced": track_prop.get("forced_track"),
-                "text_subtitles": (
-                    track_prop.get("text_subtitles") if track["type"] == "subtitles" else None
-                ),
+                track_type: {track[0]: TrackInfo(*track[1:]) for track in tracks}
+                for track_type, tracks in cache_entry[2].items()
             }
+        except (AttributeError, IndexError, TypeError, ValueError):
+            return None
+
+    def prune_probe_cache(self, media_file_paths: list) -> None:
+        # Entries of media files under the scanned library that no longer exist (deleted, renamed or
+        # moved) are dropped, otherwise they would be loaded and rewritten forever. Files only left
+        # out of this run by its depth/extension/regex filters keep their entries
+        if not os.path.isdir(self.file_or_library_path):
+            return
+
+        library_root = os.path.join(os.path.abspath(self.file_or_library_path), "")
+        seen_paths = {os.path.abspath(file_path) for file_path in media_file_paths}
+
+        self._probe_cache = {
+            file_path: cache_entry
+            for file_path, cache_entry in self._probe_cache.items()
+            if file_path in seen_paths
+            or not file_path.startswith(library_root)
+            or os.path.exists(file_path)
+        }
 
-        mkvmerge_path = os.path.join(
-            "mkvmerge" if not self.mkvmerge_location else Path(self.mkvmerge_location)
+    def process_media_file_info(self, file_path: str) -> [str, str]:
+        # Unchanged files (same size and modification time) reuse the tracks info of a previous run
+        if self.use_cache:
+            file_stat = os.stat(file_path)
+            cache_key = os.path.abspath(file_path)
+            tracks_info = self.cached_tracks_info(self._probe_cache.get(cache_key), file_stat)
+
+            if tracks_info is not None:
+                return file_path, tracks_info
+
+        # MKVToolNix reports both results and errors on stdout, so only that pipe is read
+        process = subproc_run(
+            [self._mkvmerge_path, "-J", file_path],
+            stdout=PIPE,
+            stderr=DEVNULL,
+            check=False,
+            creationflags=SUBPROCESS_CREATION_FLAGS,
         )
-
-        process = Popen([mkvmerge_path, "-J", file_path], shell=True, stdout=PIPE, stderr=PIPE)
-        output, errors = process.communicate()
+        output = process.stdout
 
         if process.returncode == 0:
-            media_tracks_info = json.loads(output.decode("utf-8"))["tracks"]
+            # Parse the raw bytes directly (no decoded str copy), only the track list is kept
+            media_tracks_info = json_loads(output)["tracks"]
             tracks_info = {"audio": {}, "subtitles": {}}
 
+            # The track type picks its dict directly, other types (video, buttons...) have none
             for track in media_tracks_info:
-                if track["type"] in ["audio", "subtitles"]:
-                    tracks_info[track["type"]][track["id"]] = extract_track_info(track)
+                tracks_of_type = tracks_info.get(track["type"])
+                if tracks_of_type is not None:
+                    tracks_of_type[track["id"]] = self.extract_track_info(track)
+
+            if self.use_cache:
+                self._probe_cache[cache_key] = self.probe_cache_entry(file_stat, tracks_info)
 
             return file_path, tracks_info
         else:
-            try:
-                raise Exception(
-                    "".join(error for error in json.loads(output.decode("utf8"))["errors"])
-                )
-            except json.decoder.JSONDecodeError:
-                raise Exception(output.decode("utf8"))
+            raise Exception(_mkvtoolnix_error_message(output))
 
-    def get_media_files_info(self) -> dict:
+    def get_media_file_paths(self) -> list:
         media_file_paths = []
 
         if os.path.isdir(self.file_or_library_path):
-            media_dirs = self.list_directories(self.file_or_library_path, self.file_search_depth)
-
-            for folder in media_dirs:
-                _, _, media_file_names = next(os.walk(folder))
-
-                for name in media_file_names:
-                    if name.endswith(self.file_extensions) and (
-                        not self.regex_filter or re.match(self.regex_filter, name)
-                    ):
-                        media_file_paths.append(os.path.join(folder, name))
+            # Extension and regex matching both happen in the (parallel) directory scan itself
+            media_file_paths = [
+                entry.path
+                for entry in self.iter_media_files(
+                    self.file_or_library_path,
+                    self.file_search_depth,
+                    self._file_extensions,
+                    self.pool_size,
+                    self._regex_filter,
+                )
+            ]
         else:
-            if self.file_or_library_path.endswith(self.file_extensions):
+            if self.file_or_library_path.lower().endswith(self._file_extensions):
                 media_file_paths = [self.file_or_library_path]
 
         if len(media_file_paths) == 0:
             LOGGER.error(
-                f"Media file list is empty (no .mkv file(s) could "
-                f'be found), double check pathing and/or filters: "{self.file_or_library_path}", "{self.regex_filter}"'
+                "Media file list is empty (no .mkv file(s) could "
+                'be found), double check pathing and/or filters: "%s", "%s"',
+                self.file_or_library_path,
+                self.regex_filter,
             )
 
+        return media_file_paths
+
+    def get_media_files_info(self) -> dict:
+        media_file_paths = self.get_media_file_paths()
+
         media_info = {}
 
-        with Pool(processes=self.pool_size) as pool:
+        if self.use_cache:
+            self._probe_cache = self.load_probe_cache()
+
+        # Probing is bound by the mkvmerge subprocesses, threads avoid the process spawn/pickle cost.
+        # Results are keyed by path, so take them as they complete rather than behind a slow file
+        with ThreadPool(processes=self.pool_size) as pool:
             results = list(
                 tqdm(
-                    pool.imap(self.process_media_file_info, media_file_paths),
+                    pool.imap_unordered(self.process_media_file_info, media_file_paths),
                     total=len(media_file_paths),
                     desc="Gathering Media Files Info",
                     unit="files",
+                    disable=len(media_file_paths) <= 1,
+                    mininterval=0.5,
                 )
             )
 
         for file_path, tracks_info in results:
             media_info[file_path] = tracks_info
 
+        if self.use_cache:
+            self.prune_probe_cache(media_file_paths)
+            self.save_probe_cache(self._probe_cache)
+
         return media_info
 
-    def process_media_file_tracks(
-        self, media_file_info: tuple
-    ) -> tuple[tuple[str, int], int, int, int, int, int, int]:
+    def has_desired_default_tracks(self, tracks_info: dict) -> bool:
+        for code, track_type in self._track_lang_codes:
+            default_languages = {
+                track.language
+                for track in tracks_info.get(track_type, {}).values()
+                if track.default
+            }
+
+            # "off" means no subtitle track should be flagged as default
+            if default_languages != (set() if code == "off" else {code}):
+                return False
+        return True
+
+    def process_media_file_tracks(self, media_file_info: tuple) -> tuple[str, FileCounts]:
         successful_count = 0
         estimated_successful = 0
         unchanged_count = 0
@@ -256,173 +532,191 @@ class MKVAudioSubsDefaulter(object):
         invalid_count = 0
         failed_count = 0
 
-        self.set_log_level()
-
         media_file, tracks_info = media_file_info
 
         LOGGER.info("")
-        LOGGER.info(f"Processing media file: {media_file}")
+        LOGGER.info("Processing media file: %s", media_file)
 
-        media_file_ext = os.path.splitext(media_file.lower())[1]
+        media_file_ext = os.path.splitext(media_file)[1].lower()
 
-        if not media_file.lower().endswith(".mkv"):
-            LOGGER.warning(f'Skipping File - "{media_file}" is NOT a matroska (.mkv) file')
+        if media_file_ext != ".mkv":
+            LOGGER.warning('Skipping File - "%s" is NOT a matroska (.mkv) file', media_file)
             invalid_count += 1
+        elif self.has_desired_default_tracks(tracks_info):
+            LOGGER.warning(
+                'The desired languages are already the default tracks in "%s", no changes needed',
+                media_file,
+            )
+            unchanged_count += 1
         else:
             mkv_cmds = []
             no_changes = False
 
-            for code, track_type in [
-                (self.audio_lang_code, "audio"),
-                (self.subtitle_lang_code, "subtitles"),
-            ]:
-                code = code.lower() if code is not None else code
-
-                if code is not None and self.verify_language_code(code, track_type):
-                    current_default_track_num = None
-                    new_default_track_num = None
-
-                    # --set flag-default=<1_for_ENABLE_0_for_DISABLE>
-                    for track_num, track in tracks_info.get(track_type, {}).items():
-                        if track["default"]:
-                            current_default_track_num = track_num
-
-                            if code not in [track["language"], "off"]:
-                                track_num = (
-                                    (current_default_track_num - len(tracks_info.get("audio", {})))
-                                    if track_type == "subtitles"
-                                    else current_default_track_num
-                                )
+            # Subtitle track ids come after the audio track ids, mkvpropedit numbers them from 1
+            audio_track_count = len(tracks_info.get("audio", {}))
+
+            for code, track_type in self._track_lang_codes:
+                current_default_track_num = None
+                new_default_track_num = None
+                tracks_of_type = tracks_info.get(track_type, {})
+
+                # --set flag-default=<1_for_ENABLE_0_for_DISABLE>
+                for track_num, track in tracks_of_type.items():
+                    if track.default:
+                        current_default_track_num = track_num
 
-                                mkv_cmds += [
+                        if code not in [track.language, "off"]:
+                            track_num = (
+                                (current_default_track_num - audio_track_count)
+                                if track_type == "subtitles"
+                                else current_default_track_num
+                            )
+
+                            mkv_cmds.extend(
+                                (
                                     "--edit",
                                     f"track:{track_type[0]}{track_num}",
                                     "--set",
                                     "flag-default=0",
-                                ]
-                            LOGGER.debug(f"Current Default - File: {media_file}, Track: {track}")
-                        elif track_type == "subtitles" and current_default_track_num is None:
-                            current_default_track_num = "off"
-
-                        if track["language"] == code:
-                            new_default_track_num = track_num
-                            LOGGER.debug(f"New Default - File: {media_file}, Track: {track}")
-                        elif current_default_track_num == code == "off":
-                            new_default_track_num = code
-
-                    # Checks if no subtitles exist in the media file
-                    if (
-                        track_type == "subtitles"
-                        and not tracks_info.get(track_type)
-                        and code == "off"
-                    ):
-                        LOGGER.warning(
-                            f'The desired {track_type} language ("{code}") is already the default {track_type} track'
-                        )
-                    else:
-                        if new_default_track_num is None:
-                            if self.default_method == "strict":
-                                if code != "off" or current_default_track_num is None:
-                                    LOGGER.error(
-                                        f'"{track_type.capitalize()}" language ("{code}") track does not exist in media file: "{media_file}"'
-                                    )
-                                    miss_track_count += 1
-                                    no_changes = True
-                                else:
-                                    LOGGER.info(
-                                        f'"{track_type.capitalize()}" language ("{code}") track exists in media file: "{media_file}"'
-                                    )
-                                    current_default_track_num -= (
-                                        len(tracks_info.get("audio", {}))
-                                        if track_type == "subtitles"
-                                        else 0
-                                    )
-                                    mkv_cmds += [
+                                )
+                            )
+                        LOGGER.debug("Current Default - File: %s, Track: %s", media_file, track)
+                    elif track_type == "subtitles" and current_default_track_num is None:
+                        current_default_track_num = "off"
+
+                    if track.language == code:
+                        new_default_track_num = track_num
+                        LOGGER.debug("New Default - File: %s, Track: %s", media_file, track)
+                    elif current_default_track_num == code == "off":
+                        new_default_track_num = code
+
+                # Checks if no subtitles exist in the media file
+                if track_type == "subtitles" and not tracks_of_type and code == "off":
+                    LOGGER.warning(
+                        'The desired %s language ("%s") is already the default %s track',
+                        track_type,
+                        code,
+                        track_type,
+                    )
+                else:
+                    if new_default_track_num is None:
+                        if self.default_method == "strict":
+                            if code != "off" or current_default_track_num is None:
+                                LOGGER.error(
+                                    '"%s" language ("%s") track does not exist in media file: "%s"',
+                                    track_type.capitalize(),
+                                    code,
+                                    media_file,
+                                )
+                                miss_track_count += 1
+                                no_changes = True
+                            else:
+                                LOGGER.info(
+                                    '"%s" language ("%s") track exists in media file: "%s"',
+                                    track_type.capitalize(),
+                                    code,
+                                    media_file,
+                                )
+                                current_default_track_num -= (
+                                    audio_track_count if track_type == "subtitles" else 0
+                                )
+                                mkv_cmds.extend(
+                                    (
                                         "--edit",
                                         f"track:{track_type[0]}{current_default_track_num}",
                                         "--set",
                                         "flag-default=0",
-                                    ]
-                            elif self.default_method == "lazy":
-                                LOGGER.warning(
-                                    f'"{self.default_method}" -dm/--default-method used, error ignored: "{track_type.capitalize()}" '
-                                    f'language ("{code}") track does not exist in media file: "{media_file}"'
+                                    )
                                 )
-                        elif current_default_track_num == new_default_track_num:
+                        elif self.default_method == "lazy":
                             LOGGER.warning(
-                                f'The desired {track_type} language ("{code}") is already the default {track_type} track'
-                            )
-                        else:
-                            LOGGER.info(
-                                f'"{track_type.capitalize()}" language ("{code}") track exists in media file: "{media_file}"'
+                                '"%s" -dm/--default-method used, error ignored: "%s" '
+                                'language ("%s") track does not exist in media file: "%s"',
+                                self.default_method,
+                                track_type.capitalize(),
+                                code,
+                                media_file,
                             )
+                    elif current_default_track_num == new_default_track_num:
+                        LOGGER.warning(
+                            'The desired %s language ("%s") is already the default %s track',
+                            track_type,
+                            code,
+                            track_type,
+                        )
+                    else:
+                        LOGGER.info(
+                            '"%s" language ("%s") track exists in media file: "%s"',
+                            track_type.capitalize(),
+                            code,
+                            media_file,
+                        )
 
-                            flag = 0 if new_default_track_num == "off" else 1
+                        flag = 0 if new_default_track_num == "off" else 1
 
-                            new_default_track_num = (
-                                current_default_track_num
-                                if new_default_track_num == "off"
-                                else new_default_track_num
-                            )
+                        new_default_track_num = (
+                            current_default_track_num
+                            if new_default_track_num == "off"
+                            else new_default_track_num
+                        )
 
-                            new_default_track_num -= (
-                                len(tracks_info.get("audio", {}))
-                                if track_type == "subtitles"
-                                else 0
-                            )
-                            mkv_cmds += [
+                        new_default_track_num -= (
+                            audio_track_count if track_type == "subtitles" else 0
+                        )
+                        mkv_cmds.extend(
+                            (
                                 "--edit",
                                 f"track:{track_type[0]}{new_default_track_num}",
                                 "--set",
                                 f"flag-default={flag}",
-                            ]
+                            )
+                        )
 
             if mkv_cmds and not no_changes:
-                mkvpropedit_path = os.path.join(
-                    "mkvpropedit"
-                    if not self.mkvpropedit_location
-                    else Path(self.mkvpropedit_location)
-                )
-
-                full_cmd = [
-                    mkvpropedit_path,
-                    os.path.join(os.path.dirname(__file__), media_file),
-                ] + mkv_cmds
+                # Same path mkvmerge was given (relative paths resolve against the working directory)
+                full_cmd = [self._mkvpropedit_path, media_file] + mkv_cmds
 
-                LOGGER.debug(f'Constructed CMD: {" ".join(full_cmd)}')
+                # The join is only worth doing when the debug record will actually be emitted
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug("Constructed CMD: %s", " ".join(full_cmd))
 
                 if not self.dry_run:
-                    process = Popen(full_cmd, shell=True, stdout=PIPE, stderr=PIPE)
-                    output, errors = process.communicate()
+                    process = subproc_run(
+                        full_cmd,
+                        stdout=PIPE,
+                        stderr=DEVNULL,
+                        check=False,
+                        creationflags=SUBPROCESS_CREATION_FLAGS,
+                    )
+                    output = process.stdout
 
                     if process.returncode != 0:
-                        try:
-                            LOGGER.error(
-                                "".join(
-                                    error for error in json.loads(output.decode("utf8"))["errors"]
-                                )
-                            )
-                        except json.decoder.JSONDecodeError:
-                            LOGGER.error(output.decode("utf8"))
+                        LOGGER.error(_mkvtoolnix_error_message(output))
                         failed_count += 1
                     else:
-                        LOGGER.info(f"Successfully Processed: {media_file}")
+                        LOGGER.info("Successfully Processed: %s", media_file)
                         successful_count += 1
+
+                        # mkvpropedit changed the file, drop its (now stale) info so the next
+                        # run probes the flags actually written instead of guessing them here
+                        if self.use_cache:
+                            self._probe_cache.pop(os.path.abspath(media_file), None)
                 else:
                     LOGGER.info(
-                        f'"-dr/--dry-run" flag was used (No Changes) - Successfully Processed: {media_file}'
+                        '"-dr/--dry-run" flag was used (No Changes) - Successfully Processed: %s',
+                        media_file,
                     )
                     estimated_successful += 1
             elif no_changes:
                 LOGGER.warning(
-                    f'No changes were made because one or more tracks did not exist in "{media_file}"'
+                    'No changes were made because one or more tracks did not exist in "%s"',
+                    media_file,
                 )
             else:
                 LOGGER.info("No media file changes were made")
                 unchanged_count += 1
 
-        return (
-            (media_file_ext, 1),
+        return media_file_ext, FileCounts(
             successful_count,
             estimated_successful,
             unchanged_count,
@@ -431,74 +725,111 @@ class MKVAudioSubsDefaulter(object):
             failed_count,
         )
 
-    def change_default_tracks(self, media_files_info: dict) -> None:
-        media_file_types = {}
+    def probe_and_process_media_file(self, file_path: str) -> tuple[str, FileCounts]:
+        # Other files may already have been edited, so a failed probe only fails this file
+        # instead of ending the run without a summary
+        try:
+            media_file_info = self.process_media_file_info(file_path)
+        except Exception as e:
+            LOGGER.error('Unable to get the media file info of "%s": %s', file_path, e)
+            return os.path.splitext(file_path)[1].lower(), FileCounts(failed=1)
 
-        successful_count = 0
-        estimated_successful = 0
-        unchanged_count = 0
-        miss_track_count = 0
-        invalid_count = 0
-        failed_count = 0
+        return self.process_media_file_tracks(media_file_info)
 
-        with Pool(processes=self.pool_size) as pool:
-            for counts in tqdm(
-                pool.imap(self.process_media_file_tracks, media_files_info.items()),
-                total=len(media_files_info),
-                desc="Processing Media Files",
-                unit="files",
-            ):
-                if counts[0][0] not in media_file_types:
-                    media_file_types[counts[0][0]] = 0
-                media_file_types[counts[0][0]] += counts[0][1]
-
-                successful_count += counts[1]
-                estimated_successful += counts[2]
-                unchanged_count += counts[3]
-                miss_track_count += counts[4]
-                invalid_count += counts[5]
-                failed_count += counts[6]
-
-        print(
-            "\n{} Total Files: {:,}\n".format(
-                "(DRY RUN)" if self.dry_run else " " * 9, len(media_files_info)
-            )
-            + ("=" * 28)
+    def change_default_tracks(self, media_files_info: dict = None) -> None:
+        # Logging is shared by the worker threads, so it only needs configuring once per run
+        self.set_log_level()
+
+        # The requested codes are the same for every media file, so verify them once up front
+        for code, track_type in self._track_lang_codes:
+            self.verify_language_code(code, track_type)
+
+        # Loaded in both paths, the edited files' entries are dropped from it and saved afterwards
+        if self.use_cache:
+            self._probe_cache = self.load_probe_cache()
+
+        # Without pre-gathered info each worker probes and then edits its file, so edits start
+        # right away instead of waiting for the whole library to be probed first
+        if media_files_info is None:
+            worker, media_files = self.probe_and_process_media_file, self.get_media_file_paths()
+        else:
+            worker, media_files = self.process_media_file_tracks, list(media_files_info.items())
+
+        # Each file edit is an independent mkvpropedit subprocess, so threads are enough to overlap them.
+        # The counts are only summed, so completion order does not matter
+        try:
+            with ThreadPool(processes=self.pool_size) as pool:
+                results = list(
+                    tqdm(
+                        pool.imap_unordered(worker, media_files),
+                        total=len(media_files),
+                        desc="Processing Media Files",
+                        unit="files",
+                        # No bar for a single file, and fewer redraws on large libraries
+                        disable=len(media_files) <= 1,
+                        mininterval=0.5,
+                    )
+                )
+        finally:
+            # Keep the info probed so far even if the run is interrupted (pre-gathered info was
+            # already pruned to the scanned files by get_media_files_info)
+            if self.use_cache:
+                if media_files_info is None:
+                    self.prune_probe_cache(media_files)
+                self.save_probe_cache(self._probe_cache)
+
+        media_file_types = Counter(media_file_ext for media_file_ext, _ in results)
+
+        # Sum the per file counts field by field in one pass
+        totals = (
+            FileCounts(*map(sum, zip(*(counts for _, counts in results))))
+            if results
+            else FileCounts()
         )
 
+        # Build the whole summary first and write it out once
+        summary = [
+            "",
+            "{} Total Files: {:,}".format(
+                "(DRY RUN)" if self.dry_run else " " * 9, len(media_files)
+            ),
+            "=" * 28,
+        ]
+
         for key, val in media_file_types.items():
-            print("{:>21}: {:,}".format(key, val))
-        print("-" * 28)
+            summary.append("{:>21}: {:,}".format(key, val))
+        summary.append("-" * 28)
 
         if self.dry_run:
-            print(" Estimated Successful: {:,}".format(estimated_successful))
+            summary.append(" Estimated Successful: {:,}".format(totals.estimated_successful))
         else:
-            print("Successful Processing: {:,}".format(successful_count))
+            summary.append("Successful Processing: {:,}".format(totals.successful))
+
+        summary += [
+            "  Unchanged/Untouched: {:,}".format(totals.unchanged),
+            "     Missing Track(s): {:,}".format(totals.missing_tracks),
+            "         Invalid File: {:,}".format(totals.invalid),
+            "    Failed Processing: {:,}".format(totals.failed),
+        ]
 
-        print("  Unchanged/Untouched: {:,}".format(unchanged_count))
-        print("     Missing Track(s): {:,}".format(miss_track_count))
-        print("         Invalid File: {:,}".format(invalid_count))
-        print("    Failed Processing: {:,}".format(failed_count))
+        sys.stdout.write("\n".join(summary) + "\n")
 
 
 def _runtime_output_str(total_seconds: float) -> None:
-    runtime_str = ""
+    runtime_parts = []
 
-    days = int(total_seconds // 86400)
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds // 60) % 60)
-    seconds = round(total_seconds - minutes * 60, 2)
+    # Each unit takes its whole amount off the remainder, once a unit is shown all smaller ones are too
+    for unit_seconds, unit_name in ((86400, "day(s)"), (3600, "hr(s)"), (60, "min(s)")):
+        value, total_seconds = divmod(total_seconds, unit_seconds)
 
-    if days > 0:
-        runtime_str += f"{days} day(s) "
-    if hours > 0 or days > 0:
-        runtime_str += f"{hours} hr(s) "
-    if minutes > 0 or hours > 0 or days > 0:
-        runtime_str += f"{minutes} min(s) "
-    if seconds > 0 or minutes > 0 or hours > 0 or days > 0:
-        runtime_str += f"{seconds} sec(s) "
+        if value > 0 or runtime_parts:
+            runtime_parts.append(f"{int(value)} {unit_name} ")
 
-    print(f"\n[*] Total Runtime: {runtime_str}[*]")
+    seconds = round(total_seconds, 2)
+    if seconds > 0 or runtime_parts:
+        runtime_parts.append(f"{seconds} sec(s) ")
+
+    print(f"\n[*] Total Runtime: {''.join(runtime_parts)}[*]")
 
 
 def cmd_parse_args() -> argparse.Namespace:
@@ -588,7 +919,7 @@ def cmd_parse_args() -> argparse.Namespace:
         required=False,
         type=str,
         help="Specify media file extensions to search for in a comma separated list (Default: '.mkv'),\n"
-        "EX: '.mkv,.mp4,.avi'",
+        "matched case-insensitively, EX: '.mkv,.mp4,.avi'",
     )
 
     parser.add_argument(
@@ -617,6 +948,15 @@ def cmd_parse_args() -> argparse.Namespace:
         help="Perform a dry run, no changes made to files but summary of predicted changes will be outputted",
     )
 
+    parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        required=False,
+        help="Probe every media file with mkvmerge, instead of reusing the cached info of files unchanged\n"
+        f"since the previous run (cache location: {os.path.dirname(PROBE_CACHE_PATH)})",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -712,19 +1052,20 @@ def main():
         mkvpropedit_location=args.mkvpropedit_location,
         mkvmerge_location=args.mkvmerge_location,
         dry_run=args.dry_run,
+        use_cache=not args.no_cache,
     )
 
     # Set logging level
     mkv.set_log_level()
 
     if args.regex_filter:
-        LOGGER.info(f'Using Regex Filter: "{args.regex_filter}"')
+        LOGGER.info('Using Regex Filter: "%s"', args.regex_filter)
 
     if args.language_codes:
         mkv.get_language_codes(print_codes=True)
 
     if args.file or args.library:
-        mkv.change_default_tracks(mkv.get_media_files_info())
+        mkv.change_default_tracks()
 
 
 if __name__ == "__main__":